@@ -2,32 +2,103 @@
 """
 Bolt Download Manager Benchmark Tool
 Compares BoltDM vs IDM vs Browser download speeds
+Requires Python 3.9+; --side-by-side and --parallel need Python 3.11+ (asyncio.TaskGroup)
 """
 
 import argparse
+import asyncio
+import functools
 import os
 import subprocess
+import sys
 import tempfile
 import time
+import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
 from pathlib import Path
-from typing import Optional, Tuple, List, Dict
-import statistics
+from typing import Optional, Tuple, Dict
 import csv
 import re
 
+# Speed values in BoltDM progress output, like "@ 43.2 MB/s" or "43.2 MB/s"
+_SPEED_RE = re.compile(rb'(\d+\.?\d*)\s*MB/s')
+_READ_CHUNK = 64 * 1024
+_WARMUP_BYTES = 1024 * 1024
+_CSV_BUFFER = 64 * 1024
+
+# Output directories already created this session
+_dirs_created = set()
+
+# Shared keep-alive session so repeated probes to the same origin skip TCP/TLS setup
+_SESSION = requests.Session()
+_SESSION.headers['Connection'] = 'keep-alive'
+for _prefix in ('http://', 'https://'):
+    _SESSION.mount(_prefix, HTTPAdapter(pool_connections=4, pool_maxsize=4))
+
+@functools.lru_cache(maxsize=32)
+def _head_content_length(url: str) -> Optional[int]:
+    """HEAD the URL once and cache the result (failures raise and are not cached)"""
+    resp = _SESSION.head(url, timeout=10, allow_redirects=True)
+    resp.raise_for_status()
+    length = resp.headers.get('Content-Length')
+    return int(length) if length else None
+
 def get_content_length(url: str) -> Optional[int]:
     """Get Content-Length from HEAD request"""
     try:
-        resp = requests.head(url, timeout=10, allow_redirects=True)
-        resp.raise_for_status()
-        length = resp.headers.get('Content-Length')
-        return int(length) if length else None
+        return _head_content_length(url)
     except Exception as e:
         print(f"HEAD request failed: {e}")
         return None
 
-def benchmark_boltdm(boltdm_path: str, url: str, output_file: str) -> Tuple[float, float, float]:
+def _safe_size(path: str) -> int:
+    """Size of path in bytes from a single stat(), 0 if it doesn't exist"""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+def _remove_if_exists(path: str):
+    """Delete path, ignoring a file the tool never created"""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _scan_peak(buf: bytes, end: int, peak: float) -> float:
+    """Running max of the MB/s values in buf[:end], without building a match list"""
+    for m in _SPEED_RE.finditer(buf, 0, end):
+        speed = float(m.group(1))
+        if speed > peak:
+            peak = speed
+    return peak
+
+async def _kill(proc: asyncio.subprocess.Process):
+    """
+    Kill and reap a child that is still running. Used when a benchmark is cancelled
+    (e.g. a sibling task failed) so the downloader doesn't outlive the script and
+    keep its output file open inside the temp directory.
+    """
+    if proc.returncode is None:
+        proc.kill()
+    await proc.wait()
+
+def warm_up(url: str):
+    """
+    Fetch the first MiB of the URL and discard it so the first measured run
+    doesn't pay for cold DNS and a cold origin/CDN cache.
+    """
+    try:
+        with _SESSION.get(url, headers={'Range': f'bytes=0-{_WARMUP_BYTES - 1}'},
+                          stream=True, timeout=10) as resp:
+            resp.raise_for_status()
+            # Cap the read in case the server ignores Range and sends the whole file
+            resp.raw.read(_WARMUP_BYTES)
+    except Exception as e:
+        print(f"Warm-up request failed: {e}")
+
+async def benchmark_boltdm(boltdm_path: str, url: str, output_file: str) -> Tuple[float, float, float]:
     """
     Benchmark BoltDM download.
     Returns: (duration_seconds, avg_speed_mbps, peak_speed_mbps)
@@ -36,32 +107,33 @@ def benchmark_boltdm(boltdm_path: str, url: str, output_file: str) -> Tuple[floa
     cmd = [boltdm_path, url, "-o", output_file]
 
     start = time.perf_counter()
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+
+    # Track peak speed while the progress stream arrives instead of buffering it all.
+    # Progress redraws end in '\r', so only scan up to the last complete line and
+    # carry the partial one into the next chunk.
+    peak_speed = 0.0
+    pending = b''
+    try:
+        while chunk := await proc.stdout.read(_READ_CHUNK):
+            buf = pending + chunk if pending else chunk
+            cut = max(buf.rfind(b'\r'), buf.rfind(b'\n')) + 1
+            peak_speed = _scan_peak(buf, cut, peak_speed)
+            pending = buf[cut:]
+        peak_speed = _scan_peak(pending, len(pending), peak_speed)
+
+        await proc.wait()
+    except BaseException:
+        await _kill(proc)
+        raise
     end = time.perf_counter()
 
     duration = end - start
 
-    # Parse output for peak speed - scan ALL lines for speed values
-    peak_speed = 0.0
-    all_output = result.stdout + result.stderr
-
-    # Find all speed values like "@ 43.2 MB/s" or "43.2 MB/s"
-    speed_pattern = r'(\d+\.?\d*)\s*MB/s'
-    matches = re.findall(speed_pattern, all_output)
-    for match in matches:
-        try:
-            speed = float(match)
-            if speed > peak_speed:
-                peak_speed = speed
-        except:
-            pass
-
     # Calculate avg speed from file size
-    if os.path.exists(output_file):
-        file_size = os.path.getsize(output_file)
-        avg_speed = (file_size / (1024 * 1024)) / duration if duration > 0 else 0
-    else:
-        avg_speed = 0
+    file_size = _safe_size(output_file)
+    avg_speed = (file_size / (1024 * 1024)) / duration if duration > 0 else 0
 
     # If peak is still 0, use avg_speed as peak
     if peak_speed == 0:
@@ -69,88 +141,166 @@ def benchmark_boltdm(boltdm_path: str, url: str, output_file: str) -> Tuple[floa
 
     return duration, avg_speed, peak_speed
 
-def benchmark_browser(url: str, output_file: str) -> Tuple[float, float]:
+BROWSER_TOOLS = ('curl', 'powershell')
+
+# URL and output path arrive as script arguments, so quotes in the URL can't
+# break out of the command the way they could in a -Command string.
+# Keep $ProgressPreference: Windows PowerShell redraws the Invoke-WebRequest
+# progress bar synchronously per chunk, which caps it far below network speed.
+_PS_SCRIPT = """param($Url, $Out)
+$ProgressPreference = 'SilentlyContinue'
+Invoke-WebRequest -Uri $Url -OutFile $Out
+"""
+
+def write_ps_script(directory: str) -> str:
+    """Write the PowerShell download script into directory and return its path"""
+    path = os.path.join(directory, 'browser_download.ps1')
+    with open(path, 'w') as f:
+        f.write(_PS_SCRIPT)
+    return path
+
+async def benchmark_browser(url: str, output_file: str, tool: str = 'curl',
+                            ps_script: Optional[str] = None) -> Tuple[float, float]:
     """
-    Benchmark browser download using PowerShell Invoke-WebRequest.
+    Benchmark a single-connection "browser-class" download.
+    tool='curl' uses curl.exe (bundled with Windows 10+); tool='powershell' runs
+    ps_script (see write_ps_script) with Invoke-WebRequest, kept for comparison
+    with older results.
     Returns: (duration_seconds, avg_speed_mbps)
     """
-    cmd = [
-        "powershell", "-Command",
-        f"Invoke-WebRequest -Uri '{url}' -OutFile '{output_file}'"
-    ]
+    if tool == 'curl':
+        cmd = ["curl.exe", "-s", "-L", "-o", output_file, url]
+    else:
+        cmd = [
+            "powershell", "-NoProfile", "-ExecutionPolicy", "Bypass",
+            "-File", ps_script, url, output_file
+        ]
 
     start = time.perf_counter()
-    subprocess.run(cmd, capture_output=True)
+    # Output is never read, so discard it rather than buffering it through pipes
+    proc = await asyncio.create_subprocess_exec(
+        *cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    try:
+        await proc.wait()
+    except BaseException:
+        await _kill(proc)
+        raise
     end = time.perf_counter()
 
     duration = end - start
 
     # Calculate avg speed
-    if os.path.exists(output_file):
-        file_size = os.path.getsize(output_file)
-        avg_speed = (file_size / (1024 * 1024)) / duration if duration > 0 else 0
-    else:
-        avg_speed = 0
+    file_size = _safe_size(output_file)
+    avg_speed = (file_size / (1024 * 1024)) / duration if duration > 0 else 0
 
     return duration, avg_speed
 
-def run_benchmark(url: str, runs: int, boltdm_path: str, idm_time: Optional[float],
-                  idm_speed: Optional[float], idm_peak: Optional[float],
-                  file_size_mb: float) -> dict:
-    """Run full benchmark suite"""
-    results: Dict[str, Dict[str, List]] = {
-        'boltdm': {'times': [], 'avg_speeds': [], 'peak_speeds': []},
-        'idm': {'times': [], 'avg_speeds': [], 'peak_speeds': []},
-        'browser': {'times': [], 'avg_speeds': []}
+async def run_benchmark(url: str, runs: int, boltdm_path: str, idm_time: Optional[float],
+                        idm_speed: Optional[float], idm_peak: Optional[float],
+                        file_size_mb: float, side_by_side: bool = False,
+                        browser_tool: str = 'curl', scratch_dir: Optional[str] = None,
+                        warmup: bool = True, eager_cleanup: bool = False,
+                        parallel: int = 1) -> dict:
+    """
+    Run full benchmark suite.
+    With side_by_side, BoltDM and Browser download concurrently within each run
+    (throughput-ceiling measurement); otherwise they run one after the other.
+    parallel > 1 overlaps up to that many independent runs; the default of 1
+    keeps runs strictly serial for a fair comparison.
+    """
+    # Run count is known up front, so fill fixed-size buffers by index
+    results: Dict[str, Dict[str, np.ndarray]] = {
+        'boltdm': {key: np.empty(runs, dtype=np.float64)
+                   for key in ('times', 'avg_speeds', 'peak_speeds')},
+        'idm': {key: np.empty(0, dtype=np.float64)
+                for key in ('times', 'avg_speeds', 'peak_speeds')},
+        'browser': {key: np.empty(runs, dtype=np.float64)
+                    for key in ('times', 'avg_speeds')}
     }
 
     # Add manual IDM results if provided
     if idm_time is not None:
-        results['idm']['times'].append(idm_time)
+        results['idm']['times'] = np.array([idm_time], dtype=np.float64)
         # Calculate speed from time if not provided
         if idm_speed is None:
             idm_speed = file_size_mb / idm_time if idm_time > 0 else 0
-        results['idm']['avg_speeds'].append(idm_speed)
+        results['idm']['avg_speeds'] = np.array([idm_speed], dtype=np.float64)
         if idm_peak is not None:
-            results['idm']['peak_speeds'].append(idm_peak)
-
-    # Get expected file size
-    print(f"Fetching file info for {url}...")
-    expected_size = get_content_length(url)
-    if expected_size:
-        print(f"Content-Length: {expected_size / (1024*1024):.2f} MB")
-    filename = url.split('/')[-1] or 'download'
-    if '?' in filename:
-        filename = filename.split('?')[0]
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        for run in range(runs):
-            print(f"\n=== Run {run + 1}/{runs} ===")
-
-            # Benchmark BoltDM
-            print("Testing BoltDM...", end=" ", flush=True)
-            output_file = os.path.join(tmpdir, f"boltdm_{run}.bin")
-            duration, avg_speed, peak_speed = benchmark_boltdm(boltdm_path, url, output_file)
-            results['boltdm']['times'].append(duration)
-            results['boltdm']['avg_speeds'].append(avg_speed)
-            results['boltdm']['peak_speeds'].append(peak_speed)
+            results['idm']['peak_speeds'] = np.array([idm_peak], dtype=np.float64)
+
+    if warmup:
+        print("Warming up...")
+        await asyncio.to_thread(warm_up, url)
+
+    # scratch_dir on a RAM disk keeps the target drive's write speed out of the numbers
+    with tempfile.TemporaryDirectory(dir=scratch_dir) as tmpdir:
+        ps_script = write_ps_script(tmpdir) if browser_tool == 'powershell' else None
+
+        async def one_run(run: int):
+            boltdm_file = os.path.join(tmpdir, f"boltdm_{run}.bin")
+            browser_file = os.path.join(tmpdir, f"browser_{run}.bin")
+            # Other runs may print while this one waits, so use labelled one-line results
+            labelled = side_by_side or parallel > 1
+            prefix = f"[Run {run + 1}/{runs}] " if parallel > 1 else ""
+            if parallel == 1:
+                print(f"\n=== Run {run + 1}/{runs} ===")
+
+            if side_by_side:
+                print(f"{prefix}Testing BoltDM + Browser ({browser_tool}) side-by-side...", flush=True)
+                async with asyncio.TaskGroup() as tg:
+                    boltdm_task = tg.create_task(benchmark_boltdm(boltdm_path, url, boltdm_file))
+                    browser_task = tg.create_task(benchmark_browser(url, browser_file, browser_tool, ps_script))
+                boltdm_result = boltdm_task.result()
+                browser_result = browser_task.result()
+            else:
+                # Benchmark BoltDM
+                if not labelled:
+                    print("Testing BoltDM...", end=" ", flush=True)
+                boltdm_result = await benchmark_boltdm(boltdm_path, url, boltdm_file)
+
+            duration, avg_speed, peak_speed = boltdm_result
+            results['boltdm']['times'][run] = duration
+            results['boltdm']['avg_speeds'][run] = avg_speed
+            results['boltdm']['peak_speeds'][run] = peak_speed
+            if labelled:
+                print(f"{prefix}BoltDM:", end=" ")
             print(f"{duration:.2f}s, {avg_speed:.2f} MB/s avg, {peak_speed:.2f} MB/s peak")
 
-            # Clean up
-            if os.path.exists(output_file):
-                os.remove(output_file)
-
-            # Benchmark Browser
-            print("Testing Browser (PowerShell)...", end=" ", flush=True)
-            output_file = os.path.join(tmpdir, f"browser_{run}.bin")
-            duration, avg_speed = benchmark_browser(url, output_file)
-            results['browser']['times'].append(duration)
-            results['browser']['avg_speeds'].append(avg_speed)
+            # Files are removed with tmpdir at the end; only delete now if space is tight
+            if eager_cleanup:
+                _remove_if_exists(boltdm_file)
+
+            if not side_by_side:
+                # Benchmark Browser
+                if not labelled:
+                    print(f"Testing Browser ({browser_tool})...", end=" ", flush=True)
+                browser_result = await benchmark_browser(url, browser_file, browser_tool, ps_script)
+
+            duration, avg_speed = browser_result
+            results['browser']['times'][run] = duration
+            results['browser']['avg_speeds'][run] = avg_speed
+            if labelled:
+                print(f"{prefix}Browser:", end=" ")
             print(f"{duration:.2f}s, {avg_speed:.2f} MB/s")
 
-            # Clean up
-            if os.path.exists(output_file):
-                os.remove(output_file)
+            if eager_cleanup:
+                _remove_if_exists(browser_file)
+
+        if parallel == 1:
+            for run in range(runs):
+                await one_run(run)
+        else:
+            print(f"\n=== {runs} runs, up to {parallel} at a time ===")
+            slots = asyncio.Semaphore(parallel)
+
+            async def bounded_run(run: int):
+                async with slots:
+                    await one_run(run)
+
+            # Each run fills its own buffer index, so completion order doesn't matter
+            async with asyncio.TaskGroup() as tg:
+                for run in range(runs):
+                    tg.create_task(bounded_run(run))
 
     # Print IDM manual results
     if idm_time is not None:
@@ -159,21 +309,26 @@ def run_benchmark(url: str, runs: int, boltdm_path: str, idm_time: Optional[floa
 
     return results
 
+def _median(values) -> float:
+    """Median of a run series via numpy's O(n) selection, 0.0 when empty"""
+    arr = np.asarray(values, dtype=np.float64)
+    return float(np.median(arr)) if arr.size else 0.0
+
 def calculate_median(results: dict) -> dict:
     """Calculate median values for each tool"""
     medians = {}
     for tool, data in results.items():
         medians[tool] = {
-            'time': statistics.median(data['times']) if data['times'] else 0,
-            'avg_speed': statistics.median(data['avg_speeds']) if data['avg_speeds'] else 0,
-            'peak_speed': statistics.median(data['peak_speeds']) if data.get('peak_speeds') else 0
+            'time': _median(data['times']),
+            'avg_speed': _median(data['avg_speeds']),
+            'peak_speed': _median(data.get('peak_speeds', ()))
         }
 
     # Calculate peak as highest avg_speed across all runs if peak_speed is 0
     if medians.get('boltdm', {}).get('peak_speed', 0) == 0:
-        all_speeds = results.get('boltdm', {}).get('avg_speeds', [])
-        if all_speeds:
-            medians['boltdm']['peak_speed'] = max(all_speeds)
+        all_speeds = np.asarray(results.get('boltdm', {}).get('avg_speeds', ()), dtype=np.float64)
+        if all_speeds.size:
+            medians['boltdm']['peak_speed'] = float(all_speeds.max())
 
     return medians
 
@@ -197,11 +352,20 @@ def print_results(medians: dict, file_size_mb: float, has_manual_idm: bool):
 
     print("=" * 80)
 
+def _ensure_dir(path: str):
+    """makedirs once per directory; chart and CSV share the output dir"""
+    if path not in _dirs_created:
+        os.makedirs(path, exist_ok=True)
+        _dirs_created.add(path)
+
 def generate_chart(medians: dict, output_path: str, file_size_mb: float, has_manual_idm: bool):
     """Generate comparison chart"""
     try:
+        import matplotlib
+        # Select the non-interactive backend before pyplot loads so it skips GUI
+        # backend detection (slow on Windows); the chart is only saved to file
+        matplotlib.use('Agg')
         import matplotlib.pyplot as plt
-        import numpy as np
 
         tools = ['BoltDM', 'IDM', 'Browser']
         colors = ['#2196F3', '#4CAF50', '#9E9E9E']
@@ -268,7 +432,7 @@ def generate_chart(medians: dict, output_path: str, file_size_mb: float, has_man
         plt.tight_layout(rect=[0, 0.05, 1, 1])
 
         # Create docs directory if needed
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        _ensure_dir(os.path.dirname(output_path))
         plt.savefig(output_path, dpi=150, bbox_inches='tight', facecolor='white')
         print(f"\nChart saved to {output_path}")
 
@@ -277,16 +441,17 @@ def generate_chart(medians: dict, output_path: str, file_size_mb: float, has_man
 
 def generate_csv(medians: dict, output_path: str, has_manual_idm: bool):
     """Generate CSV with raw data"""
-    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    _ensure_dir(os.path.dirname(output_path))
 
-    with open(output_path, 'w', newline='') as f:
-        writer = csv.writer(f)
-        writer.writerow(['Tool', 'Time (s)', 'Avg Speed (MB/s)', 'Peak Speed (MB/s)', 'Notes'])
-        for tool, data in medians.items():
-            if data['time'] > 0:
-                peak_str = f"{data['peak_speed']:.2f}" if data['peak_speed'] > 0 else "N/A"
-                note = "manual measurement" if tool == 'idm' and has_manual_idm else ""
-                writer.writerow([tool, f"{data['time']:.2f}", f"{data['avg_speed']:.2f}", peak_str, note])
+    rows = [['Tool', 'Time (s)', 'Avg Speed (MB/s)', 'Peak Speed (MB/s)', 'Notes']]
+    for tool, data in medians.items():
+        if data['time'] > 0:
+            peak_str = f"{data['peak_speed']:.2f}" if data['peak_speed'] > 0 else "N/A"
+            note = "manual measurement" if tool == 'idm' and has_manual_idm else ""
+            rows.append([tool, f"{data['time']:.2f}", f"{data['avg_speed']:.2f}", peak_str, note])
+
+    with open(output_path, 'w', newline='', buffering=_CSV_BUFFER) as f:
+        csv.writer(f).writerows(rows)
 
     print(f"CSV saved to {output_path}")
 
@@ -321,7 +486,32 @@ def main():
     parser.add_argument('--idm-speed', type=float, help='Manual IDM avg speed in MB/s (calculated from time if omitted)')
     parser.add_argument('--idm-peak', type=float, help='Manual IDM peak speed in MB/s')
     parser.add_argument('--output-dir', default='docs', help='Output directory for chart and CSV')
+    parser.add_argument('--no-chart', action='store_true', help='Skip chart generation (matplotlib is never imported)')
+    parser.add_argument('--no-csv', action='store_true', help='Skip CSV generation')
+    parser.add_argument('--side-by-side', action='store_true',
+                        help='Run BoltDM and Browser concurrently in each run (throughput ceiling, not a fair comparison)')
+    parser.add_argument('--parallel', type=int, default=1, metavar='N',
+                        help='Run up to N runs at once (default: 1). Runs then share the link, so only '
+                             'use this when the tools, not the network, are the bottleneck (e.g. a local server)')
+    parser.add_argument('--browser-tool', choices=BROWSER_TOOLS, default='curl',
+                        help='Single-connection baseline: curl.exe (default) or PowerShell Invoke-WebRequest')
+    parser.add_argument('--scratch-dir',
+                        help='Directory for downloaded files (default: system temp). A RAM disk '
+                             '(ImDisk on Windows, tmpfs such as /dev/shm on Linux) keeps disk speed out of the results')
+    parser.add_argument('--no-warmup', action='store_true',
+                        help='Skip the discarded 1 MiB warm-up fetch before the first run')
+    parser.add_argument('--eager-cleanup', action='store_true',
+                        help='Delete each downloaded file right after its run instead of at the end '
+                             '(use when the scratch directory cannot hold every run)')
     args = parser.parse_args()
+    if args.runs < 0:
+        parser.error("--runs must be at least 0")
+    if args.parallel < 1:
+        parser.error("--parallel must be at least 1")
+    if (args.side_by_side or args.parallel > 1) and sys.version_info < (3, 11):
+        parser.error("--side-by-side and --parallel require Python 3.11 or newer")
+    if args.scratch_dir and not os.path.isdir(args.scratch_dir):
+        parser.error(f"--scratch-dir {args.scratch_dir} is not an existing directory")
 
     # Resolve paths
     script_dir = Path(__file__).parent.parent
@@ -333,7 +523,10 @@ def main():
         return
 
     # Get file size
+    print(f"Fetching file info for {args.url}...")
     expected_size = get_content_length(args.url)
+    if expected_size:
+        print(f"Content-Length: {expected_size / (1024*1024):.2f} MB")
     file_size_mb = expected_size / (1024 * 1024) if expected_size else 500
 
     print(f"BoltDM: {boltdm_path}")
@@ -344,15 +537,21 @@ def main():
         print(f"IDM (manual): {args.idm_time}s")
 
     # Run benchmark
-    results = run_benchmark(
+    results = asyncio.run(run_benchmark(
         url=args.url,
         runs=args.runs,
         boltdm_path=str(boltdm_path),
         idm_time=args.idm_time,
         idm_speed=args.idm_speed,
         idm_peak=args.idm_peak,
-        file_size_mb=file_size_mb
-    )
+        file_size_mb=file_size_mb,
+        side_by_side=args.side_by_side,
+        browser_tool=args.browser_tool,
+        scratch_dir=args.scratch_dir,
+        warmup=not args.no_warmup,
+        eager_cleanup=args.eager_cleanup,
+        parallel=args.parallel
+    ))
 
     # Calculate medians
     medians = calculate_median(results)
@@ -363,8 +562,10 @@ def main():
 
     # Generate outputs
     output_dir = script_dir / args.output_dir
-    generate_chart(medians, str(output_dir / 'benchmark.png'), file_size_mb, has_manual_idm)
-    generate_csv(medians, str(output_dir / 'benchmark.csv'), has_manual_idm)
+    if not args.no_chart:
+        generate_chart(medians, str(output_dir / 'benchmark.png'), file_size_mb, has_manual_idm)
+    if not args.no_csv:
+        generate_csv(medians, str(output_dir / 'benchmark.csv'), has_manual_idm)
     print_markdown(medians, file_size_mb, has_manual_idm)
 
 if __name__ == '__main__':